@@ -289,7 +289,7 @@ def blast_lca(db,
         tax_id = process_blast_hits(db, blast_group, top_percent)
         query_id = blast_group[0].query_id
         if not tax_id:
-            log.debug('Query: {} has no valid taxonomy paths.'.format(query_id))
+            log.debug('Query: %s has no valid taxonomy paths.', query_id)
         classified = 'C' if tax_id else 'U'
         output.write('{}\t{}\t{}\n'.format(classified, query_id, tax_id))
 
@@ -1024,7 +1024,7 @@ def filter_bam_to_taxa(in_bam, read_IDs_to_tax_IDs, out_bam,
             for name in names:
                 if name_pattern.match(name):
                     tax_ids_from_headings.add(row_tax_id)
-                    log.debug("Found taxName match: %s -> %s" % (row_tax_id,name))
+                    log.debug("Found taxName match: %s -> %s", row_tax_id, name)
                     found_heading = True
                     break
             if found_heading:
@@ -71,7 +71,7 @@ def assert_md5_equal_to_line_in_file(testCase, filename, checksum_file, msg=None
 
     hash_md5 = hashlib.md5()
     with open(filename, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
             hash_md5.update(chunk)
 
     expected_checksum = ""
@@ -3,7 +3,6 @@
 __author__ = "dpark@broadinstitute.org"
 
 import assembly
-import util.cmd
 import util.file
 import Bio.SeqIO
 import Bio.Data.IUPACData
@@ -12,8 +11,6 @@ import argparse
 import os
 import os.path
 import shutil
-import tempfile
-import argparse
 import itertools
 import pytest
 import tools.mummer
@@ -22,18 +19,9 @@ import tools.picard
 from test import TestCaseWithTmp, _CPUS
 
 
-def makeFasta(seqs, outFasta):
-    with open(outFasta, 'wt') as outf:
-        for line in util.file.fastaMaker(seqs):
-            outf.write(line)
-
-
-class TestCommandHelp(unittest.TestCase):
-
-    def test_help_parser_for_each_command(self):
-        for cmd_name, parser_fun in assembly.__commands__:
-            parser = parser_fun(argparse.ArgumentParser())
-            helpstring = parser.format_help()
+@pytest.mark.parametrize("cmd_name,parser_fun", assembly.__commands__, ids=[c[0] for c in assembly.__commands__])
+def test_help_parser_for_each_command(cmd_name, parser_fun):
+    parser_fun(argparse.ArgumentParser()).format_help()
 
 
 class TestRefineAssemble(TestCaseWithTmp):
@@ -732,7 +720,7 @@ class TestDeambigAndTrimFasta(TestCaseWithTmp):
     def run_method(self, inseqs, parser_fun):
         fasta_in = util.file.mkstempfname()
         fasta_out = util.file.mkstempfname()
-        makeFasta([(str(i), inseqs[i]) for i in range(len(inseqs))], fasta_in)
+        util.file.makeFastaFile([(str(i), inseqs[i]) for i in range(len(inseqs))], fasta_in)
         args = parser_fun(argparse.ArgumentParser()).parse_args([fasta_in, fasta_out])
         args.func_main(args)
         return (fasta_in, fasta_out)
@@ -6,7 +6,6 @@ __author__ = "tomkinsc@broadinstitute.org"
 import os
 import sys
 import tempfile
-import unittest
 import argparse
 import tarfile
 import subprocess
@@ -21,12 +20,9 @@ import util.file
 from test import TestCaseWithTmp, assert_equal_contents
 
 
-class TestCommandHelp(unittest.TestCase):
-
-    def test_help_parser_for_each_command(self):
-        for cmd_name, parser_func in file_utils.__commands__:
-            parser = parser_func(argparse.ArgumentParser())
-            helpstring = parser.format_help()
+@pytest.mark.parametrize("cmd_name,parser_fun", file_utils.__commands__, ids=[c[0] for c in file_utils.__commands__])
+def test_help_parser_for_each_command(cmd_name, parser_fun):
+    parser_fun(argparse.ArgumentParser()).format_help()
 
 class TestTarballMerger(TestCaseWithTmp):
     def setUp(self):
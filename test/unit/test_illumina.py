@@ -3,11 +3,11 @@
 
 __author__ = "dpark@broadinstitute.org"
 
-import unittest
 import os
 import os.path
 import tempfile
 import argparse
+import pytest
 import filecmp
 import util
 import util.file
@@ -16,12 +16,9 @@ import tools.samtools
 from test import TestCaseWithTmp
 
 
-class TestCommandHelp(unittest.TestCase):
-
-    def test_help_parser_for_each_command(self):
-        for cmd_name, parser_fun in illumina.__commands__:
-            parser = parser_fun(argparse.ArgumentParser())
-            helpstring = parser.format_help()
+@pytest.mark.parametrize("cmd_name,parser_fun", illumina.__commands__, ids=[c[0] for c in illumina.__commands__])
+def test_help_parser_for_each_command(cmd_name, parser_fun):
+    parser_fun(argparse.ArgumentParser()).format_help()
 
 
 class TestSampleSheet(TestCaseWithTmp):
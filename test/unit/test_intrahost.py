@@ -10,6 +10,7 @@ import shutil
 import tempfile
 import itertools
 import argparse
+import pytest
 import unittest
 
 # third-party
@@ -27,20 +28,13 @@ import interhost
 import tools.mafft
 
 
-class TestCommandHelp(unittest.TestCase):
-
-    def test_help_parser_for_each_command(self):
-        for cmd_name, parser_fun in intrahost.__commands__:
-            parser = parser_fun(argparse.ArgumentParser())
-            helpstring = parser.format_help()
+@pytest.mark.parametrize("cmd_name,parser_fun", intrahost.__commands__, ids=[c[0] for c in intrahost.__commands__])
+def test_help_parser_for_each_command(cmd_name, parser_fun):
+    parser_fun(argparse.ArgumentParser()).format_help()
 
 
 def makeTempFasta(seqs):
-    fn = util.file.mkstempfname('.fasta')
-    with open(fn, 'wt') as outf:
-        for line in util.file.fastaMaker(seqs):
-            outf.write(line)
-    return fn
+    return util.file.makeFastaFile(seqs, util.file.mkstempfname('.fasta'))
 
 
 class MockVphaserOutput:
@@ -8,7 +8,6 @@ import collections
 import argparse
 import logging
 import itertools
-import unittest
 
 import Bio.SeqIO
 from Bio.Seq import Seq
@@ -27,12 +26,9 @@ import tools.samtools
 
 _log = logging.getLogger(__name__)  # pylint: disable=invalid-name
 
-class TestCommandHelp(unittest.TestCase):
-
-    def test_help_parser_for_each_command(self):
-        for cmd_name, parser_fun in kmer_utils.__commands__:
-            parser = parser_fun(argparse.ArgumentParser())
-            helpstring = parser.format_help()
+@pytest.mark.parametrize("cmd_name,parser_fun", kmer_utils.__commands__, ids=[c[0] for c in kmer_utils.__commands__])
+def test_help_parser_for_each_command(cmd_name, parser_fun):
+    parser_fun(argparse.ArgumentParser()).format_help()
 
 #################################
 # Some general utils used below #
@@ -8,7 +8,6 @@ import os.path
 from os.path import join
 import tempfile
 import textwrap
-import unittest
 import pytest
 
 import mock
@@ -22,12 +21,9 @@ from test import TestCaseWithTmp, assert_equal_bam_reads, _CPUS
 
 from io import StringIO
 
-class TestCommandHelp(unittest.TestCase):
-
-    def test_help_parser_for_each_command(self):
-        for cmd_name, parser_fun in metagenomics.__commands__:
-            parser = parser_fun(argparse.ArgumentParser())
-            helpstring = parser.format_help()
+@pytest.mark.parametrize("cmd_name,parser_fun", metagenomics.__commands__, ids=[c[0] for c in metagenomics.__commands__])
+def test_help_parser_for_each_command(cmd_name, parser_fun):
+    parser_fun(argparse.ArgumentParser()).format_help()
 
 
 class TestKronaCalls(TestCaseWithTmp):
@@ -5,8 +5,8 @@ __author__ = "tomkinsc@broadinstitute.org"
 # built-ins
 import os
 import tempfile
-import unittest
 import argparse
+import pytest
 
 # module-specific
 import ncbi
@@ -15,12 +15,9 @@ import util.genbank
 from test import assert_equal_bam_reads, TestCaseWithTmp, assert_equal_contents, assert_md5_equal_to_line_in_file
 
 
-class TestCommandHelp(unittest.TestCase):
-
-    def test_help_parser_for_each_command(self):
-        for cmd_name, parser_fun in ncbi.__commands__:
-            parser = parser_fun(argparse.ArgumentParser())
-            helpstring = parser.format_help()
+@pytest.mark.parametrize("cmd_name,parser_fun", ncbi.__commands__, ids=[c[0] for c in ncbi.__commands__])
+def test_help_parser_for_each_command(cmd_name, parser_fun):
+    parser_fun(argparse.ArgumentParser()).format_help()
 
 class TestFeatureReader(TestCaseWithTmp):
     def setUp(self):
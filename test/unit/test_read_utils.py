@@ -2,8 +2,8 @@
 
 __author__ = "irwin@broadinstitute.org"
 
-import unittest
 import argparse
+import pytest
 import filecmp
 import os
 import glob
@@ -19,12 +19,9 @@ import util.file
 from test import TestCaseWithTmp, assert_equal_bam_reads
 
 
-class TestCommandHelp(unittest.TestCase):
-
-    def test_help_parser_for_each_command(self):
-        for cmd_name, parser_fun in read_utils.__commands__:
-            parser = parser_fun(argparse.ArgumentParser())
-            helpstring = parser.format_help()
+@pytest.mark.parametrize("cmd_name,parser_fun", read_utils.__commands__, ids=[c[0] for c in read_utils.__commands__])
+def test_help_parser_for_each_command(cmd_name, parser_fun):
+    parser_fun(argparse.ArgumentParser()).format_help()
 
 
 class TestPurgeUnmated(TestCaseWithTmp):
@@ -11,6 +11,7 @@ import filecmp
 import subprocess
 
 import argparse
+import pytest
 
 import read_utils
 import taxon_filter
@@ -21,12 +22,9 @@ import tools.bmtagger
 import tools.blast
 from test import assert_equal_bam_reads, assert_equal_contents, assert_equal_bam_reads, assert_md5_equal_to_line_in_file, TestCaseWithTmp
 
-class TestCommandHelp(unittest.TestCase):
-
-    def test_help_parser_for_each_command(self):
-        for cmd_name, parser_fun in taxon_filter.__commands__:
-            parser = parser_fun(argparse.ArgumentParser())
-            helpstring = parser.format_help()
+@pytest.mark.parametrize("cmd_name,parser_fun", taxon_filter.__commands__, ids=[c[0] for c in taxon_filter.__commands__])
+def test_help_parser_for_each_command(cmd_name, parser_fun):
+    parser_fun(argparse.ArgumentParser()).format_help()
 
 
 
@@ -17,7 +17,6 @@ import errno
 import logging
 import json
 import sys
-import io
 import csv
 import inspect
 import tarfile
@@ -489,19 +488,15 @@ def fastaMaker(seqs, linewidth=60):
     for idVal, seq in seqs:
         yield ">{}\n".format(idVal)
 
-        while len(seq) > linewidth:
-            line = seq[:linewidth]
-            seq = seq[linewidth:]
-            yield "{}\n".format(line)
-
-        if seq:
-            yield seq + "\n"
+        # slice by offset rather than repeatedly re-slicing the remainder,
+        # which copies the rest of the sequence for every output line
+        for i in range(0, len(seq), linewidth):
+            yield seq[i:i + linewidth] + "\n"
 
 
 def makeFastaFile(seqs, outFasta):
     with open(outFasta, 'wt') as outf:
-        for line in fastaMaker(seqs):
-            outf.write(line)
+        outf.writelines(fastaMaker(seqs))
 
     return outFasta
 